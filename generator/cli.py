@@ -4,65 +4,527 @@ Facade (GoF): Simplifica acceso a validator y creator.
 """
 
 import argparse
+import functools
+import os
+import re
+import string
+import sys
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from rich import box
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
-from rich.prompt import Confirm, Prompt
-from rich.table import Table
-from rich.tree import Tree
-
-from generator.creator import ProjectCreator
-from generator.python_creator import PythonProjectCreator
-from generator.typescript_creator import TypeScriptProjectCreator
 from generator.validator import ValidationError, create_validator_chain
 
-console = Console()
-
-
-# Presets Configuration
-PRESETS = {
-    "chatbot-simple": {
-        "type": "typescript",
-        "package_manager": "pnpm",
-        "default_llm": "gpt-5.1",
-        "include_rag": False,
-        "include_queue": False,
-        "full": False,
-        "scaffold_only": True,
-        "description": "Chatbot simple con estructura básica (scaffold)",
-    },
-    "rag-enterprise": {
-        "type": "typescript",
-        "package_manager": "pnpm",
-        "default_llm": "gpt-5.1",
-        "include_rag": True,
-        "include_queue": True,
-        "full": True,
-        "scaffold_only": False,
-        "description": "Sistema RAG empresarial completo con colas y embeddings",
-    },
-    "multi-agent-system": {
-        "type": "typescript",
-        "package_manager": "pnpm",
-        "default_llm": "gpt-5.1",
-        "include_rag": True,
-        "include_queue": True,
-        "full": True,
-        "scaffold_only": False,
-        "description": "Sistema multi-agente completo con RAG, colas y múltiples modelos",
-    },
+# Rich y los creators se importan de forma perezosa dentro de cada método:
+# `--help` y los errores de argparse terminan sin cargar el grafo de Rich.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+    from rich.tree import Tree
+
+
+@dataclass(frozen=True, slots=True)
+class Preset:
+    """
+    Value Object: Configuración inmutable de un preset.
+
+    Attributes:
+        type: Tipo de proyecto al que aplica.
+        package_manager: Gestor de paquetes.
+        default_llm: Modelo LLM por defecto.
+        include_rag: Si incluir sistema RAG.
+        include_queue: Si incluir sistema de colas.
+        full: Si generar implementación completa.
+        scaffold_only: Si generar solo el scaffold.
+        description: Texto mostrado al elegir preset.
+    """
+
+    type: str
+    package_manager: str
+    default_llm: str
+    include_rag: bool
+    include_queue: bool
+    full: bool
+    scaffold_only: bool
+    description: str
+
+
+@dataclass(slots=True)
+class ProjectConfig:
+    """
+    Information Expert (GRASP): Configuración normalizada del comando create.
+
+    Se construye una vez a partir de los argumentos parseados. Todos los
+    campos existen siempre con su default, así que el resto del CLI accede
+    a ellos directamente, sin getattr defensivos.
+    """
+
+    project_name: str | None = None
+    type: str | None = None
+    output_dir: Path | None = None
+    overwrite: bool = False
+    no_docker: bool = False
+    no_tests: bool = False
+    no_cicd: bool = False
+    jobs: int | None = None
+    hash_algo: str = "argon2"
+    package_manager: str = "pnpm"
+    yes: bool = False
+    non_interactive: bool = False
+    default_llm: str = "gpt-5.1"
+    include_rag: bool = False
+    include_queue: bool = False
+    scaffold_only: bool = False
+    full: bool = False
+    preset: str | None = None
+    # Ruta final del proyecto, calculada al cerrar la configuración
+    target_path: Path | None = field(default=None, init=False)
+    # Opciones dadas en el CLI con un valor distinto de su default
+    explicit: frozenset[str] = field(default=frozenset(), init=False)
+
+    def __post_init__(self) -> None:
+        """Registra qué opciones llegaron explícitas para no volver a preguntarlas."""
+        self.explicit = frozenset(
+            name for name, default in _CREATE_DEFAULTS.items() if getattr(self, name) != default
+        )
+
+    @classmethod
+    def from_namespace(cls, namespace: argparse.Namespace) -> "ProjectConfig":
+        """
+        Factory Method (GoF): Normaliza los argumentos parseados de create.
+
+        Args:
+            namespace: Resultado de argparse.
+
+        Returns:
+            ProjectConfig con todos los campos definidos.
+        """
+        values = vars(namespace)
+        return cls(**{name: values[name] for name in _CREATE_DEFAULTS})
+
+    def creator_options(self) -> dict[str, Any]:
+        """
+        Information Expert (GRASP): Opciones que espera el ProjectCreator.
+
+        Returns:
+            Opciones comunes más las específicas del lenguaje elegido.
+        """
+        options: dict[str, Any] = {
+            "include_docker": not self.no_docker,
+            "include_tests": not self.no_tests,
+            "include_cicd": not self.no_cicd,
+            "overwrite": self.overwrite,
+            "jobs": self.jobs,
+        }
+        if self.type == "python":
+            options["hash_algo"] = self.hash_algo
+        else:
+            options.update(
+                package_manager=self.package_manager,
+                default_llm=self.default_llm,
+                include_rag=self.include_rag,
+                include_queue=self.include_queue,
+                full=self.full,
+            )
+        return options
+
+
+# Presets Configuration (solo lectura: se comparte entre parser, prompts y apply_preset)
+PRESETS: Mapping[str, Preset] = MappingProxyType(
+    {
+        "chatbot-simple": Preset(
+            type="typescript",
+            package_manager="pnpm",
+            default_llm="gpt-5.1",
+            include_rag=False,
+            include_queue=False,
+            full=False,
+            scaffold_only=True,
+            description="Chatbot simple con estructura básica (scaffold)",
+        ),
+        "rag-enterprise": Preset(
+            type="typescript",
+            package_manager="pnpm",
+            default_llm="gpt-5.1",
+            include_rag=True,
+            include_queue=True,
+            full=True,
+            scaffold_only=False,
+            description="Sistema RAG empresarial completo con colas y embeddings",
+        ),
+        "multi-agent-system": Preset(
+            type="typescript",
+            package_manager="pnpm",
+            default_llm="gpt-5.1",
+            include_rag=True,
+            include_queue=True,
+            full=True,
+            scaffold_only=False,
+            description="Sistema multi-agente completo con RAG, colas y múltiples modelos",
+        ),
+    }
+)
+
+_PRESET_NAMES = tuple(PRESETS)
+_PRESET_CHOICES_WITH_NONE = ("none", *_PRESET_NAMES)
+
+# Componentes comunes del prompt multi-selección: (nombre, flag --no-* asociado)
+_COMPONENT_FLAGS = (("docker", "no_docker"), ("tests", "no_tests"), ("cicd", "no_cicd"))
+
+# Qué se puede modificar tras rechazar la confirmación ("opciones" = las del lenguaje)
+_EDIT_CHOICES = ("todo", "nombre", "directorio", "componentes", "opciones", "cancelar")
+
+# Opciones del comando create compartidas por argparse y por _fast_parse
+_TYPE_CHOICES = ("python", "typescript")
+_HASH_ALGO_CHOICES = ("argon2", "bcrypt")
+_PACKAGE_MANAGER_CHOICES = ("pnpm", "npm", "yarn")
+_LLM_CHOICES = ("gpt-5.1", "claude-sonnet-4.5", "claude-opus-4.1", "gemini-3")
+
+# Defaults del comando create, derivados de ProjectConfig (única fuente)
+_CREATE_DEFAULTS: dict[str, Any] = {
+    spec.name: spec.default for spec in fields(ProjectConfig) if spec.init
+}
+
+# Estructura estática mostrada tras crear el proyecto: (etiqueta, hijos)
+type _TreeNodes = tuple[tuple[str, "_TreeNodes"], ...]
+
+_PYTHON_TREE_NODES: _TreeNodes = (
+    ("app/", ()),
+    ("tests/", ()),
+    ("pyproject.toml", ()),
+)
+
+_TYPESCRIPT_TREE_NODES: _TreeNodes = (
+    (
+        "src/",
+        (
+            ("agents/ (LLM Agnostic Core)", ()),
+            ("database/ (Drizzle ORM)", ()),
+            ("config/", ()),
+        ),
+    ),
+    ("package.json", ()),
+    ("docker-compose.yml", ()),
+)
+
+# Texto de "Next steps" de cada lenguaje, parseado una vez al importar
+_PYTHON_NEXT_STEPS = string.Template(
+    "[bold white]Next steps:[/bold white]\n\n"
+    "[cyan]1.[/cyan] cd $name\n"
+    "[cyan]2.[/cyan] uv sync\n"
+    "[cyan]3.[/cyan] docker-compose up -d\n"
+    "[cyan]4.[/cyan] alembic upgrade head\n"
+    "[cyan]5.[/cyan] uv run uvicorn app.main:app --reload"
+)
+
+_TYPESCRIPT_NEXT_STEPS = string.Template(
+    "[bold white]Next steps:[/bold white]\n\n"
+    "[cyan]1.[/cyan] cd $name\n"
+    "[cyan]2.[/cyan] $pm install\n"
+    "[cyan]3.[/cyan] docker-compose up -d db redis\n"
+    "[cyan]4.[/cyan] $run_cmd db:push\n"
+    "[cyan]5.[/cyan] $run_cmd start:dev\n\n"
+    "[bold green]API Docs:[/bold green] http://localhost:3000/api/docs"
+)
+
+# Variantes sin markup para salida redirigida (CI, logs), derivadas una vez
+_MARKUP_TAG = re.compile(r"\[/?[a-z ]+\]")
+_PYTHON_NEXT_STEPS_PLAIN = string.Template(_MARKUP_TAG.sub("", _PYTHON_NEXT_STEPS.template))
+_TYPESCRIPT_NEXT_STEPS_PLAIN = string.Template(_MARKUP_TAG.sub("", _TYPESCRIPT_NEXT_STEPS.template))
+
+
+def _build_tree(project_name: str, nodes: _TreeNodes) -> "Tree":
+    """
+    Helper: Materializa un Tree de Rich a partir de una estructura estática.
+
+    Args:
+        project_name: Etiqueta de la raíz.
+        nodes: Hijos de la raíz como tuplas (etiqueta, hijos).
+
+    Returns:
+        Tree listo para imprimir.
+    """
+    from rich.tree import Tree
+
+    tree = Tree(f"[bold cyan]{project_name}[/bold cyan]", guide_style="bright_blue")
+    pending = [(tree, nodes)]
+    while pending:
+        parent, children = pending.pop()
+        for label, grandchildren in children:
+            branch = parent.add(label)
+            if grandchildren:
+                pending.append((branch, grandchildren))
+    return tree
+
+
+def _render_plain_tree(project_name: str, nodes: _TreeNodes) -> str:
+    """
+    Helper: Versión en texto plano (indentada) de la estructura estática.
+
+    Args:
+        project_name: Etiqueta de la raíz.
+        nodes: Hijos de la raíz como tuplas (etiqueta, hijos).
+
+    Returns:
+        Una línea por nodo, indentada según su profundidad.
+    """
+    lines = [project_name]
+    pending = [(1, node) for node in reversed(nodes)]
+    while pending:
+        depth, (label, children) = pending.pop()
+        lines.append(f"{'  ' * depth}{label}")
+        pending.extend((depth + 1, child) for child in reversed(children))
+    return "\n".join(lines)
+
+
+def _next_steps(args: ProjectConfig, *, plain: bool = False) -> str:
+    """
+    Helper: Texto de "Next steps" del lenguaje elegido.
+
+    Args:
+        args: Configuración final del proyecto.
+        plain: Si devolver la variante sin markup de Rich.
+
+    Returns:
+        Instrucciones con nombre y package manager sustituidos.
+    """
+    if args.type == "python":
+        template = _PYTHON_NEXT_STEPS_PLAIN if plain else _PYTHON_NEXT_STEPS
+        return template.substitute(name=args.project_name)
+
+    pm = args.package_manager
+    template = _TYPESCRIPT_NEXT_STEPS_PLAIN if plain else _TYPESCRIPT_NEXT_STEPS
+    return template.substitute(
+        name=args.project_name, pm=pm, run_cmd="npm run" if pm == "npm" else pm
+    )
+
+
+def _yes_no(flag: bool) -> str:
+    """Helper: bool -> 'Yes'/'No' para el resumen."""
+    return "Yes" if flag else "No"
+
+
+def _no_yes(flag: bool) -> str:
+    """Helper: flags negativos (--no-*) -> 'No'/'Yes' para el resumen."""
+    return "No" if flag else "Yes"
+
+
+def _generation_mode(full: bool) -> str:
+    """Helper: modo de generación TypeScript para el resumen."""
+    return "Full (completo)" if full else "Scaffold (mínimo)"
+
+
+# Filas del resumen de configuración: (etiqueta, atributo, formato).
+# Plantillas estáticas por lenguaje: sin ramas por fila en cada vuelta.
+type _ConfigRows = tuple[tuple[str, str, Callable[[Any], str]], ...]
+
+_COMMON_CONFIG_ROWS: _ConfigRows = (
+    ("Name", "project_name", str),
+    ("Directory", "target_path", str),
+    ("Language", "type", str.capitalize),
+    ("Docker", "no_docker", _no_yes),
+    ("Tests", "no_tests", _no_yes),
+    ("CI/CD", "no_cicd", _no_yes),
+)
+
+_PYTHON_CONFIG_ROWS: _ConfigRows = (
+    *_COMMON_CONFIG_ROWS,
+    ("Hash", "hash_algo", str.upper),
+)
+
+_TYPESCRIPT_CONFIG_ROWS: _ConfigRows = (
+    *_COMMON_CONFIG_ROWS,
+    ("Pkg Manager", "package_manager", str),
+    ("LLM Default", "default_llm", str),
+    ("RAG System", "include_rag", _yes_no),
+    ("Queue System", "include_queue", _yes_no),
+    ("Generation", "full", _generation_mode),
+)
+
+
+def _build_config_rows(config: ProjectConfig) -> list[tuple[str, str]]:
+    """
+    Helper: Filas (etiqueta, valor) del resumen en texto plano.
+
+    Args:
+        config: Configuración a resumir.
+
+    Returns:
+        Filas listas para Table.add_row.
+    """
+    rows = _PYTHON_CONFIG_ROWS if config.type == "python" else _TYPESCRIPT_CONFIG_ROWS
+    return [(label, fmt(getattr(config, attr))) for label, attr, fmt in rows]
+
+
+def _positive_int(value: str) -> int:
+    """
+    Tipo argparse: entero estrictamente positivo.
+
+    Raises:
+        argparse.ArgumentTypeError: Si el valor no es un entero > 0.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"debe ser un entero positivo: {value!r}")
+    return number
+
+
+# Opciones con valor: opción -> (conversión, choices válidos o None).
+# argparse necesita secuencias (las tuplas de arriba, para la ayuda); aquí
+# se usan frozensets de esas mismas constantes para validar por hash.
+_FAST_VALUE_OPTIONS: dict[str, tuple[Callable[[str], Any], frozenset[str] | None]] = {
+    "--type": (str, frozenset(_TYPE_CHOICES)),
+    "--output-dir": (Path, None),
+    "--jobs": (_positive_int, None),
+    "--hash-algo": (str, frozenset(_HASH_ALGO_CHOICES)),
+    "--package-manager": (str, frozenset(_PACKAGE_MANAGER_CHOICES)),
+    "--default-llm": (str, frozenset(_LLM_CHOICES)),
+    "--preset": (str, frozenset(_PRESET_NAMES)),
 }
 
+_FAST_FLAGS = frozenset(
+    {
+        "--overwrite",
+        "--no-docker",
+        "--no-tests",
+        "--no-cicd",
+        "--yes",
+        "--non-interactive",
+        "--include-rag",
+        "--include-queue",
+        "--scaffold-only",
+        "--full",
+    }
+)
+
+
+def _fast_parse(argv: list[str]) -> ProjectConfig | None:
+    """
+    Parser rápido para el caso común: create con opciones conocidas.
+
+    Evita construir el ArgumentParser y el Namespace intermedio: rellena
+    ProjectConfig directamente. Acepta un 'create' explícito como primer
+    argumento. Ante cualquier cosa que no reconozca (--help, update, flags
+    cortos o desconocidos, valores inválidos) devuelve None para que argparse
+    la procese y genere ayuda o error.
+
+    Args:
+        argv: Argumentos de línea de comandos (sin el nombre del programa).
+
+    Returns:
+        ProjectConfig equivalente al de argparse, o None si hay que delegar.
+    """
+    values = dict(_CREATE_DEFAULTS)
+    i = 1 if argv and argv[0] == "create" else 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if arg in _FAST_FLAGS:
+            values[arg[2:].replace("-", "_")] = True
+        elif arg.startswith("--"):
+            name, has_value, value = arg.partition("=")
+            spec = _FAST_VALUE_OPTIONS.get(name)
+            if spec is None:
+                return None
+            if not has_value:
+                if i >= len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+                i += 1
+            convert, choices = spec
+            if choices is not None and value not in choices:
+                return None
+            try:
+                values[name[2:].replace("-", "_")] = convert(value)
+            except (ValueError, argparse.ArgumentTypeError):
+                return None
+        elif arg.startswith("-") or arg in ("create", "update"):
+            return None
+        elif values["project_name"] is None:
+            values["project_name"] = arg
+        else:
+            return None
+
+    return ProjectConfig(**values)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """
+    Singleton perezoso: crea la Console de Rich solo cuando se va a usar.
+
+    Los mensajes del CLI ya llevan su estilo explícito con markup, así que el
+    resaltado automático por regex (números, rutas, reprs) se desactiva: era
+    trabajo extra en cada print. La detección de terminal y color se deja a
+    Rich para respetar FORCE_COLOR/NO_COLOR.
+
+    Returns:
+        Console compartida por todo el CLI.
+    """
+    from rich.console import Console
+
+    return Console(highlight=False)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_header_panel() -> "Panel":
+    """
+    Singleton perezoso: el panel de cabecera es 100% estático.
+
+    Se cachea el renderable (no sus segmentos): el render final depende del
+    ancho y capacidades de la terminal, que Rich resuelve en cada print.
+
+    Returns:
+        Panel de cabecera compartido.
+    """
+    from rich import box
+    from rich.panel import Panel
+
+    return Panel.fit(
+        "[bold cyan]Project Generator CLI[/bold cyan]\n"
+        "[dim]Arquitectura limpia con SOLID + GoF + GRASP[/dim]\n"
+        "[dim]Soporte: Python (FastAPI) & TypeScript (NestJS)[/dim]",
+        border_style="cyan",
+        box=box.DOUBLE,
+    )
+
+
+_COMMANDS = ("create", "update")
+
+
+@functools.lru_cache(maxsize=len(_COMMANDS) + 1)
+def _get_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Cache perezosa: construye cada variante del parser una sola vez por proceso.
+
+    Args:
+        command: Subcomando de la invocación o None (create por defecto).
+
+    Returns:
+        ArgumentParser compartido entre instancias de CLI.
+    """
+    return CLI._create_parser(command)
+
 
-def apply_preset(args: argparse.Namespace, preset_name: str) -> None:
+def _peek_command(argv: list[str]) -> str | None:
+    """
+    Helper: Devuelve el subcomando si es el primer token de argv.
+    """
+    return argv[0] if argv and argv[0] in _COMMANDS else None
+
+
+def apply_preset(args: ProjectConfig, preset_name: str) -> None:
     """
     Strategy (GoF): Aplica configuración de preset a args.
 
     Args:
-        args: Namespace de argumentos.
+        args: Configuración del proyecto.
         preset_name: Nombre del preset a aplicar.
     """
     if preset_name not in PRESETS:
@@ -71,26 +533,26 @@ def apply_preset(args: argparse.Namespace, preset_name: str) -> None:
     preset = PRESETS[preset_name]
 
     # Aplicar configuración del preset
-    if not hasattr(args, "type") or not args.type:
-        args.type = preset["type"]
+    if not args.type:
+        args.type = preset.type
 
     if args.type == "typescript":
         # Aplicar solo si no están explícitamente configurados
         # Para strings/defaults: verificar si está en su valor por defecto
-        if not hasattr(args, "package_manager") or args.package_manager == "pnpm":
-            args.package_manager = preset.get("package_manager", "pnpm")
-        if not hasattr(args, "default_llm") or args.default_llm == "gpt-5.1":
-            args.default_llm = preset.get("default_llm", "gpt-5.1")
-        # Para flags booleanos: argparse siempre crea el atributo con False por defecto,
-        # así que verificamos si el valor actual es False (default) antes de aplicar el preset
-        if not hasattr(args, "include_rag") or not args.include_rag:
-            args.include_rag = preset.get("include_rag", False)
-        if not hasattr(args, "include_queue") or not args.include_queue:
-            args.include_queue = preset.get("include_queue", False)
-        if not hasattr(args, "full") or not args.full:
-            args.full = preset.get("full", False)
-        if not hasattr(args, "scaffold_only") or not args.scaffold_only:
-            args.scaffold_only = preset.get("scaffold_only", False)
+        if args.package_manager == "pnpm":
+            args.package_manager = preset.package_manager
+        if args.default_llm == "gpt-5.1":
+            args.default_llm = preset.default_llm
+        # Para flags booleanos: el default es False, así que solo se aplica el
+        # preset si el valor actual es False
+        if not args.include_rag:
+            args.include_rag = preset.include_rag
+        if not args.include_queue:
+            args.include_queue = preset.include_queue
+        if not args.full:
+            args.full = preset.full
+        if not args.scaffold_only:
+            args.scaffold_only = preset.scaffold_only
 
 
 class CLI:
@@ -108,54 +570,66 @@ class CLI:
 
     def __init__(self):
         """
-        Inicializa CLI con cadena de validadores y parser.
+        Inicializa CLI con cadena de validadores (compartida).
         """
         self._validator_chain = create_validator_chain()
-        self._parser = self._create_parser()
+        # Directorio de trabajo: lo fija run() al inicio (un solo getcwd por run)
+        self._cwd: Path
 
-    def _create_parser(self) -> argparse.ArgumentParser:
+    @staticmethod
+    def _create_parser(command: str | None = None) -> argparse.ArgumentParser:
         """
         Information Expert (GRASP): Conoce estructura de args.
 
+        Solo construye lo que la invocación necesita: el subparser del comando
+        pedido o, sin comando, los argumentos de create en el parser raíz.
+
+        Args:
+            command: Subcomando de la invocación ("create", "update") o None.
+
         Returns:
             ArgumentParser configurado.
         """
         parser = argparse.ArgumentParser(
             description="🚀 Generador de proyectos Multi-lenguaje (Python & TypeScript)",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="Ejemplos:\n"
+            epilog="Comandos:\n"
+            "  create  Crear nuevo proyecto (comando por defecto)\n"
+            "  update  Actualizar proyecto existente (ver: update --help)\n"
+            "\n"
+            "Ejemplos:\n"
             "  python -m template-proyects my-api --type python\n"
             "  python -m template-proyects --preset chatbot-simple\n"
             "  python -m template-proyects update --add-rag\n"
             "  python -m template-proyects  # Modo interactivo completo",
         )
 
-        # Subparsers para comandos create/update
-        subparsers = parser.add_subparsers(dest="command", help="Comando a ejecutar")
-        subparsers.required = False  # Default a 'create' si no se especifica
+        # Sin subcomando: create es el comando por defecto
+        if command is None:
+            CLI._add_create_arguments(parser)
+            return parser
 
-        # ===== CREATE COMMAND (default) =====
-        create_parser = subparsers.add_parser(
-            "create",
-            help="Crear nuevo proyecto (comando por defecto)",
-            description="Crea un nuevo proyecto desde cero",
-        )
-        self._add_create_arguments(create_parser)
-
-        # ===== UPDATE COMMAND =====
-        update_parser = subparsers.add_parser(
-            "update",
-            help="Actualizar proyecto existente",
-            description="Agrega funcionalidades a un proyecto existente",
-        )
-        self._add_update_arguments(update_parser)
+        subparsers = parser.add_subparsers(dest="command", help="Comando a ejecutar")
 
-        # Agregar argumentos también al parser principal para backward compatibility
-        self._add_create_arguments(parser)
+        if command == "create":
+            create_parser = subparsers.add_parser(
+                "create",
+                help="Crear nuevo proyecto (comando por defecto)",
+                description="Crea un nuevo proyecto desde cero",
+            )
+            CLI._add_create_arguments(create_parser)
+        else:
+            update_parser = subparsers.add_parser(
+                "update",
+                help="Actualizar proyecto existente",
+                description="Agrega funcionalidades a un proyecto existente",
+            )
+            CLI._add_update_arguments(update_parser)
 
         return parser
 
-    def _add_create_arguments(self, parser: argparse.ArgumentParser) -> None:
+    @staticmethod
+    def _add_create_arguments(parser: argparse.ArgumentParser) -> None:
         """Agrega argumentos para el comando create."""
         parser.add_argument(
             "project_name",
@@ -165,14 +639,13 @@ class CLI:
 
         parser.add_argument(
             "--type",
-            choices=["python", "typescript"],
+            choices=_TYPE_CHOICES,
             help="Tipo de proyecto a generar (python | typescript)",
         )
 
         parser.add_argument(
             "--output-dir",
             type=Path,
-            default=Path.cwd(),
             help="Directorio donde crear el proyecto (default: directorio actual)",
         )
 
@@ -192,22 +665,35 @@ class CLI:
             help="No generar archivos de CI/CD (.github/workflows/)",
         )
 
+        parser.add_argument(
+            "--jobs",
+            type=_positive_int,
+            help="Hilos para escribir archivos en paralelo (default: automático, 1 = secuencial)",
+        )
+
         # Opciones Python
         parser.add_argument(
             "--hash-algo",
-            choices=["bcrypt", "argon2"],
-            default="argon2",
+            choices=_HASH_ALGO_CHOICES,
+            default=_CREATE_DEFAULTS["hash_algo"],
             help="[Python] Algoritmo de hash de passwords (default: argon2)",
         )
 
         # Opciones TypeScript
         parser.add_argument(
             "--package-manager",
-            choices=["pnpm", "npm", "yarn"],
-            default="pnpm",
+            choices=_PACKAGE_MANAGER_CHOICES,
+            default=_CREATE_DEFAULTS["package_manager"],
             help="[TypeScript] Gestor de paquetes (default: pnpm)",
         )
 
+        parser.add_argument(
+            "-y",
+            "--yes",
+            action="store_true",
+            help="Crear sin pedir confirmación final (implícito si stdin no es una TTY)",
+        )
+
         parser.add_argument(
             "--non-interactive",
             action="store_true",
@@ -217,8 +703,8 @@ class CLI:
         # TS Options
         parser.add_argument(
             "--default-llm",
-            choices=["gpt-5.1", "claude-sonnet-4.5", "claude-opus-4.1", "gemini-3"],
-            default="gpt-5.1",
+            choices=_LLM_CHOICES,
+            default=_CREATE_DEFAULTS["default_llm"],
             help="[TypeScript] Modelo LLM por defecto",
         )
 
@@ -247,14 +733,14 @@ class CLI:
         )
 
         # Presets
-        preset_choices = list(PRESETS.keys())
         parser.add_argument(
             "--preset",
-            choices=preset_choices,
-            help=f"[TypeScript] Preset de configuración rápida. Opciones: {', '.join(preset_choices)}",
+            choices=_PRESET_NAMES,
+            help=f"[TypeScript] Preset de configuración rápida. Opciones: {', '.join(_PRESET_NAMES)}",
         )
 
-    def _add_update_arguments(self, parser: argparse.ArgumentParser) -> None:
+    @staticmethod
+    def _add_update_arguments(parser: argparse.ArgumentParser) -> None:
         """Agrega argumentos para el comando update."""
         parser.add_argument(
             "--add-rag",
@@ -269,7 +755,6 @@ class CLI:
         parser.add_argument(
             "--project-dir",
             type=Path,
-            default=Path.cwd(),
             help="Directorio del proyecto a actualizar (default: directorio actual)",
         )
 
@@ -283,98 +768,134 @@ class CLI:
         Returns:
             Exit code (0 = success, 1 = error, 130 = cancelled).
         """
-        parsed = self._parser.parse_args(args)
-
-        # Si no se especificó comando, default a 'create'
-        if not hasattr(parsed, "command") or not parsed.command:
-            parsed.command = "create"
+        argv = sys.argv[1:] if args is None else args
+        self._cwd = Path.cwd()
+        # Camino rápido primero; argparse solo para ayuda, update o errores
+        config = _fast_parse(argv)
+        parsed = None if config else _get_parser(_peek_command(argv)).parse_args(argv)
 
         try:
             self._show_header()
 
-            # Manejar comando update
-            if parsed.command == "update":
+            # Manejar comando update (sin comando = create)
+            if parsed is not None and getattr(parsed, "command", None) == "update":
                 return self._handle_update(parsed)
 
+            if config is None:
+                config = ProjectConfig.from_namespace(parsed)
+
             # Aplicar preset si se especificó
-            if hasattr(parsed, "preset") and parsed.preset:
-                apply_preset(parsed, parsed.preset)
+            if config.preset:
+                apply_preset(config, config.preset)
 
-            # Interactive configuration (always, but uses CLI args as defaults)
-            parsed = self._get_interactive_config(parsed)
+            # Interactive configuration (uses CLI args as defaults). Skipped
+            # entirely when the CLI already provides everything required.
+            if self._is_fully_specified(config):
+                self._apply_defaults(config)
+            else:
+                config = self._get_interactive_config(config)
 
             # Validate after getting all config
-            self._validate(parsed)
+            self._validate(config)
 
             # Confirm (with reconfiguration option)
-            parsed = self._confirm_creation(parsed)
+            config = self._confirm_creation(config)
 
-            self._create_project(parsed)
-            self._show_success(parsed)
+            self._create_project(config)
+            self._show_success(config)
             return 0
         except ValidationError as exc:
-            console.print(f"\n[red]! Error de validación:[/red] {exc}")
+            from rich.markup import escape
+
+            _get_console().print(f"\n[red]! Error de validación:[/red] {escape(str(exc))}")
             return 1
         except KeyboardInterrupt:
-            console.print("\n[yellow]! Cancelado por usuario[/yellow]")
+            _get_console().print("\n[yellow]! Cancelado por usuario[/yellow]")
             return 130
         except Exception as exc:
-            console.print(f"\n[red]! Error inesperado:[/red] {exc}")
-            console.print_exception()
+            from rich.markup import escape
+
+            console = _get_console()
+            # El mensaje puede contener entrada del usuario: nunca se interpreta como markup
+            console.print(f"\n[red]! Error inesperado:[/red] {escape(str(exc))}")
+            # El traceback de Rich lee y resalta el código fuente: solo en depuración
+            if os.environ.get("PROJECTGEN_DEBUG"):
+                console.print_exception()
+            else:
+                console.print("[dim]Define PROJECTGEN_DEBUG=1 para ver el traceback[/dim]")
             return 1
 
     def _show_header(self) -> None:
         """
         Rich UI: Header con panel.
         """
+        console = _get_console()
+
         console.print()
-        console.print(
-            Panel.fit(
-                "[bold cyan]Project Generator CLI[/bold cyan]\n"
-                "[dim]Arquitectura limpia con SOLID + GoF + GRASP[/dim]\n"
-                "[dim]Soporte: Python (FastAPI) & TypeScript (NestJS)[/dim]",
-                border_style="cyan",
-                box=box.DOUBLE,
-            )
-        )
+        console.print(_get_header_panel())
         console.print()
 
-    def _validate(self, args: argparse.Namespace) -> None:
+    def _validate(self, args: ProjectConfig) -> None:
         """
         Delega validación a cadena de validadores.
         """
-        target_path = args.output_dir / args.project_name
-
         # Solo validar si no se quiere sobrescribir
         if not args.overwrite:
-            self._validator_chain.validate(args.project_name, target_path)
+            self._validator_chain.validate(args.project_name, args.target_path)
+
+    @staticmethod
+    def _is_fully_specified(args: ProjectConfig) -> bool:
+        """
+        Indica si se puede omitir toda la fase de prompts.
+
+        Con --non-interactive, o cuando el CLI ya trae nombre y tipo: el resto
+        de opciones tiene default en el parser.
+        """
+        return args.non_interactive or bool(args.project_name and args.type)
+
+    def _apply_defaults(self, args: ProjectConfig) -> None:
+        """
+        Completa sin preguntar lo que el CLI no especificó.
 
-    def _get_interactive_config(self, args: argparse.Namespace) -> argparse.Namespace:
+        También deja en args.target_path la ruta final del proyecto.
+        """
+        if not args.project_name:
+            args.project_name = "my-app"
+        if not args.type:
+            args.type = "typescript"
+        if args.output_dir is None:
+            args.output_dir = self._cwd
+        if args.type == "typescript":
+            # Sin --full el nivel de generación es scaffold
+            args.scaffold_only = not args.full
+        args.target_path = args.output_dir / args.project_name
+
+    def _get_interactive_config(self, args: ProjectConfig) -> ProjectConfig:
         """
         Prompts user for all configuration options interactively.
         Pattern: Template Method - defines fixed sequence of prompts
+
+        Al terminar deja en args.target_path la ruta final del proyecto,
+        calculada una sola vez para validar, confirmar y crear.
         """
-        if args.non_interactive:
-            if not args.project_name:
-                args.project_name = "my-app"
-            if not args.type:
-                args.type = "typescript"
-            return args
+        from rich.prompt import Prompt
+
+        console = _get_console()
 
         console.print("[bold cyan]Configuration[/bold cyan]\n")
 
         # 0. Presets (si no se especificó uno por CLI y es TypeScript)
-        if not hasattr(args, "preset") or not args.preset:
+        if not args.preset:
             # Mostrar opción de presets solo para TypeScript o si no se ha seleccionado tipo
             if not args.type or args.type == "typescript":
                 console.print("[dim]Presets disponibles (opcionales):[/dim]")
                 for preset_name, preset_config in PRESETS.items():
-                    console.print(f"  [cyan]{preset_name}[/cyan]: {preset_config['description']}")
+                    console.print(f"  [cyan]{preset_name}[/cyan]: {preset_config.description}")
                 console.print()
 
                 preset_choice = Prompt.ask(
                     "  [cyan]Usar preset rápido? (opcional, presiona Enter para saltar)[/cyan]",
-                    choices=["none"] + list(PRESETS.keys()),
+                    choices=_PRESET_CHOICES_WITH_NONE,
                     default="none",
                 )
                 if preset_choice != "none":
@@ -390,7 +911,7 @@ class CLI:
         if not args.type:
             args.type = Prompt.ask(
                 "  [cyan]Tipo de proyecto[/cyan]",
-                choices=["python", "typescript"],
+                choices=_TYPE_CHOICES,
                 default="typescript",
             )
 
@@ -399,27 +920,16 @@ class CLI:
             args.project_name = Prompt.ask("  [cyan]Nombre del proyecto[/cyan]", default="my-app")
 
         # 3. Output Directory
-        if args.output_dir == Path.cwd():  # Default value, not explicitly set
-            output_dir_str = Prompt.ask(
-                "  [cyan]Directorio donde crear el proyecto[/cyan]", default=str(Path.cwd())
-            )
-            args.output_dir = Path(output_dir_str).expanduser().resolve()
+        # El default se resuelve aquí (no en el parser) porque el parser se cachea
+        if args.output_dir is None or args.output_dir == self._cwd:  # Not explicitly set
+            args.output_dir = self._ask_output_dir(self._cwd)
 
-        # Common Options
-        include_docker = Confirm.ask(
-            "  [cyan]¿Incluir Docker y docker-compose?[/cyan]", default=not args.no_docker
+        # Common Options: un único prompt multi-selección con lo que no fijó el CLI
+        pending = tuple(
+            (name, attr) for name, attr in _COMPONENT_FLAGS if attr not in args.explicit
         )
-        args.no_docker = not include_docker
-
-        include_tests = Confirm.ask(
-            "  [cyan]¿Incluir directorio de tests?[/cyan]", default=not args.no_tests
-        )
-        args.no_tests = not include_tests
-
-        include_cicd = Confirm.ask(
-            "  [cyan]¿Incluir GitHub Actions CI/CD?[/cyan]", default=not args.no_cicd
-        )
-        args.no_cicd = not include_cicd
+        if pending:
+            self._ask_components(args, pending)
 
         # Language Specific Options
         if args.type == "python":
@@ -427,154 +937,265 @@ class CLI:
         else:
             self._get_typescript_config(args)
 
+        args.target_path = args.output_dir / args.project_name
         console.print()
         return args
 
-    def _get_python_config(self, args: argparse.Namespace) -> None:
+    def _ask_output_dir(self, default: Path) -> Path:
+        """
+        Pregunta el directorio donde crear el proyecto.
+
+        Args:
+            default: Directorio propuesto (absoluto).
+
+        Returns:
+            Directorio elegido, absoluto.
+        """
+        from rich.prompt import Prompt
+
+        default_dir = str(default)
+        answer = Prompt.ask(
+            "  [cyan]Directorio donde crear el proyecto[/cyan]", default=default_dir
+        )
+        # El default ya es absoluto. Lo escrito se ancla al cwd y solo pasa
+        # por resolve() (realpath) si tiene '..' que colapsar
+        if answer == default_dir:
+            return default
+        output_dir = self._cwd / Path(answer).expanduser()
+        if ".." in output_dir.parts:
+            output_dir = output_dir.resolve()
+        return output_dir
+
+    @staticmethod
+    def _ask_components(args: ProjectConfig, pending: tuple[tuple[str, str], ...]) -> None:
+        """
+        Pregunta de una vez qué componentes comunes incluir y actualiza args.
+
+        Args:
+            args: Configuración actual (sus flags --no-* dan el default).
+            pending: Componentes a preguntar como (nombre, flag --no-*).
+        """
+        from rich.markup import escape
+        from rich.prompt import Prompt
+
+        console = _get_console()
+        names = [name for name, _ in pending]
+        default = ",".join(name for name, attr in pending if not getattr(args, attr)) or "none"
+
+        while True:
+            answer = Prompt.ask(
+                f"  [cyan]¿Qué incluir?[/cyan] [dim]({', '.join(names)}; "
+                "separados por comas, 'none' para nada)[/dim]",
+                default=default,
+            )
+            selected = {token.strip().lower() for token in answer.split(",")} - {"", "none"}
+            unknown = selected.difference(names)
+            if not unknown:
+                break
+            # Lo escrito por el usuario se escapa: "[/x]" no debe leerse como markup
+            console.print(f"[prompt.invalid]Opción no válida: {escape(', '.join(sorted(unknown)))}")
+
+        for name, attr in pending:
+            setattr(args, attr, name not in selected)
+
+    def _edit_config(self, args: ProjectConfig, choice: str) -> ProjectConfig:
+        """
+        Vuelve a preguntar solo la parte de la configuración elegida.
+
+        Args:
+            args: Configuración a modificar.
+            choice: Una de _EDIT_CHOICES (salvo "cancelar").
+
+        Returns:
+            Configuración actualizada, con target_path recalculado.
+        """
+        from rich.prompt import Prompt
+
+        # Al reconfigurar se puede cambiar todo, incluido lo que llegó por CLI
+        args.explicit = frozenset()
+
+        if choice == "todo":
+            return self._get_interactive_config(args)
+
+        if choice == "nombre":
+            args.project_name = Prompt.ask(
+                "  [cyan]Nombre del proyecto[/cyan]", default=args.project_name
+            )
+        elif choice == "directorio":
+            args.output_dir = self._ask_output_dir(args.output_dir)
+        elif choice == "componentes":
+            self._ask_components(args, _COMPONENT_FLAGS)
+        elif args.type == "python":
+            self._get_python_config(args)
+        else:
+            self._get_typescript_config(args)
+
+        args.target_path = args.output_dir / args.project_name
+        _get_console().print()
+        return args
+
+    def _get_python_config(self, args: ProjectConfig) -> None:
         """Prompts específicos para Python."""
+        from rich.prompt import Prompt
+
+        console = _get_console()
+
+        if "hash_algo" in args.explicit:
+            return
+
         console.print("\n[dim]Configuración Python (FastAPI)[/dim]")
         args.hash_algo = Prompt.ask(
             "  [cyan]Algoritmo de hash para passwords[/cyan]",
-            choices=["argon2", "bcrypt"],
+            choices=_HASH_ALGO_CHOICES,
             default=args.hash_algo,
         )
 
-    def _get_typescript_config(self, args: argparse.Namespace) -> None:
+    def _get_typescript_config(self, args: ProjectConfig) -> None:
         """Prompts específicos para TypeScript."""
+        from rich.prompt import Confirm, Prompt
+
+        console = _get_console()
+
         console.print("\n[dim]Configuración TypeScript (NestJS)[/dim]")
+        explicit = args.explicit
 
-        args.package_manager = Prompt.ask(
-            "  [cyan]Package Manager[/cyan]",
-            choices=["pnpm", "npm", "yarn"],
-            default=getattr(args, "package_manager", "pnpm"),
-        )
+        if "package_manager" not in explicit:
+            args.package_manager = Prompt.ask(
+                "  [cyan]Package Manager[/cyan]",
+                choices=_PACKAGE_MANAGER_CHOICES,
+                default=args.package_manager,
+            )
 
         # Default LLM Model
-        args.default_llm = Prompt.ask(
-            "  [cyan]Modelo LLM por defecto[/cyan]",
-            choices=["gpt-5.1", "claude-sonnet-4.5", "claude-opus-4.1", "gemini-3"],
-            default=getattr(args, "default_llm", "gpt-5.1"),
-        )
+        if "default_llm" not in explicit:
+            args.default_llm = Prompt.ask(
+                "  [cyan]Modelo LLM por defecto[/cyan]",
+                choices=_LLM_CHOICES,
+                default=args.default_llm,
+            )
 
         # RAG System
-        args.include_rag = Confirm.ask(
-            "  [cyan]¿Incluir sistema RAG (pgvector + embeddings)?[/cyan]",
-            default=getattr(args, "include_rag", False),
-        )
+        if "include_rag" not in explicit:
+            args.include_rag = Confirm.ask(
+                "  [cyan]¿Incluir sistema RAG (pgvector + embeddings)?[/cyan]",
+                default=args.include_rag,
+            )
 
         # Queue System
-        args.include_queue = Confirm.ask(
-            "  [cyan]¿Incluir sistema de colas (BullMQ)?[/cyan]",
-            default=getattr(args, "include_queue", False),
-        )
+        if "include_queue" not in explicit:
+            args.include_queue = Confirm.ask(
+                "  [cyan]¿Incluir sistema de colas (BullMQ)?[/cyan]",
+                default=args.include_queue,
+            )
 
         # Generation Level (scaffold vs full)
-        if not hasattr(args, "full") or not args.full:
-            args.full = False
-        if not hasattr(args, "scaffold_only") or not args.scaffold_only:
-            args.scaffold_only = False
-
-        # Si no se especificó ningún flag, preguntar
-        if not args.full and not args.scaffold_only:
+        # Se pregunta salvo que llegue por CLI; el valor actual (preset, defaults
+        # o edición previa) es el default, así el menú de edición puede cambiarlo
+        if "full" in explicit or "scaffold_only" in explicit:
+            args.scaffold_only = not args.full
+        else:
             generation_level = Prompt.ask(
                 "  [cyan]Nivel de generación[/cyan] (scaffold: estructura básica | full: implementación completa)",
                 choices=["scaffold", "full"],
-                default="scaffold",
+                default="full" if args.full else "scaffold",
             )
             args.full = generation_level == "full"
-            args.scaffold_only = generation_level == "scaffold"
-        elif args.full:
-            args.scaffold_only = False
-        else:
-            args.scaffold_only = True
+            args.scaffold_only = not args.full
 
-    def _confirm_creation(self, args: argparse.Namespace) -> argparse.Namespace:
+    def _confirm_creation(self, args: ProjectConfig) -> ProjectConfig:
         """
         Rich UI: Muestra resumen y permite reconfigurar.
+
+        Se omite con --yes, en modo no interactivo o si stdin no es una TTY
+        (pipelines/CI), sin cargar la maquinaria de prompts de Rich.
         """
-        if args.non_interactive:
+        if args.non_interactive or args.yes or not sys.stdin.isatty():
             return args
 
+        from rich.console import Group
+        from rich.markup import escape
+        from rich.prompt import Confirm, Prompt
+        from rich.table import Table
+
+        console = _get_console()
+        # Destino ya validado (por run() o tras una edición anterior)
+        validated_target = args.target_path
+        show_summary = True
+
         while True:
-            # Tabla de configuración
-            table = Table(
-                title=f"Project Configuration ({args.type})",
-                show_header=False,
-                box=box.ROUNDED,
-                border_style="blue",
-            )
-            table.add_column("Opción", style="cyan bold", width=20)
-            table.add_column("Valor", style="green")
-
-            table.add_row("Name", args.project_name)
-            table.add_row("Directory", str(args.output_dir / args.project_name))
-            table.add_row("Language", args.type.capitalize())
-            table.add_row("Docker", "No" if args.no_docker else "Yes")
-            table.add_row("Tests", "No" if args.no_tests else "Yes")
-            table.add_row("CI/CD", "No" if args.no_cicd else "Yes")
-
-            if args.type == "python":
-                table.add_row("Hash", f"{args.hash_algo.upper()}")
-            else:
-                table.add_row("Pkg Manager", getattr(args, "package_manager", "pnpm"))
-                table.add_row("LLM Default", getattr(args, "default_llm", "gpt-5.1"))
-                table.add_row("RAG System", "Yes" if getattr(args, "include_rag", False) else "No")
-                table.add_row(
-                    "Queue System", "Yes" if getattr(args, "include_queue", False) else "No"
-                )
-                generation_mode = (
-                    "Full (completo)" if getattr(args, "full", False) else "Scaffold (mínimo)"
+            if show_summary:
+                # Tabla de configuración (grid sin bordes: no genera segmentos de caja)
+                table = Table.grid(padding=(0, 2))
+                table.add_column("Opción", style="cyan bold", width=20)
+                table.add_column("Valor", style="green")
+
+                for row in _build_config_rows(args):
+                    table.add_row(*row)
+
+                # Título + tabla + línea en blanco en una sola escritura
+                console.print(
+                    Group(f"[bold blue]Project Configuration ({args.type})[/bold blue]", table, "")
                 )
-                table.add_row("Generation", generation_mode)
 
-            console.print(table)
-            console.print()
+                # Confirmar
+                if Confirm.ask("¿Crear proyecto con esta configuración?", default=True):
+                    console.print()
+                    return args
 
-            # Confirmar
-            if Confirm.ask("¿Crear proyecto con esta configuración?", default=True):
                 console.print()
-                return args
 
-            # Si rechaza, preguntar si quiere reconfigurar
-            console.print()
-            if Confirm.ask("[yellow]¿Deseas modificar la configuración?[/yellow]", default=True):
-                console.print()
-                # Preserve project_name but allow re-prompting for everything
-                args = self._get_interactive_config(args)
-            else:
+            # Si rechaza, preguntar qué modificar: solo se repite esa parte
+            choice = Prompt.ask(
+                "[yellow]¿Qué deseas modificar?[/yellow]", choices=_EDIT_CHOICES, default="todo"
+            )
+            if choice == "cancelar":
                 raise KeyboardInterrupt()
 
-    def _create_project(self, args: argparse.Namespace) -> None:
+            console.print()
+            args = self._edit_config(args, choice)
+            show_summary = True
+            # Revalidar solo si cambió el destino (nombre o directorio); un
+            # destino inválido vuelve al menú de edición sin perder la sesión
+            if args.target_path != validated_target:
+                try:
+                    self._validate(args)
+                except ValidationError as exc:
+                    console.print(f"[red]! Error de validación:[/red] {escape(str(exc))}\n")
+                    show_summary = False
+                else:
+                    validated_target = args.target_path
+
+    def _create_project(self, args: ProjectConfig) -> None:
         """
         Delega creación a ProjectCreator con Rich progress.
         Factory Method: Decide qué Creator instanciar.
         """
-        target_path = args.output_dir / args.project_name
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
-        # Opciones comunes
-        options = {
-            "include_docker": not args.no_docker,
-            "include_tests": not args.no_tests,
-            "include_cicd": not args.no_cicd,
-            "overwrite": args.overwrite,
-        }
+        from generator.creator import ProjectCreator
+
+        console = _get_console()
 
-        # Crear instancia de ProjectCreator según tipo
-        creator: ProjectCreator
+        target_path = args.target_path
 
+        # Crear instancia de ProjectCreator según tipo; solo se importa el
+        # creator (y sus templates) del lenguaje elegido
+        creator_cls: type[ProjectCreator]
         if args.type == "python":
-            options["hash_algo"] = args.hash_algo
-            creator = PythonProjectCreator(args.project_name, target_path, options)
+            from generator.python_creator import PythonProjectCreator
+
+            creator_cls = PythonProjectCreator
         else:
-            # Usar getattr() con defaults para evitar AttributeError en modo no interactivo
-            options["package_manager"] = getattr(args, "package_manager", "pnpm")
-            options["default_llm"] = getattr(args, "default_llm", "gpt-5.1")
-            options["include_rag"] = getattr(args, "include_rag", False)
-            options["include_queue"] = getattr(args, "include_queue", False)
-            options["full"] = getattr(args, "full", False)
-            creator = TypeScriptProjectCreator(args.project_name, target_path, options)
-
-        # Mostrar progreso con Rich
+            from generator.typescript_creator import TypeScriptProjectCreator
+
+            creator_cls = TypeScriptProjectCreator
+
+        creator = creator_cls(args.project_name, target_path, args.creator_options())
+
+        # Mostrar progreso con Rich. El creator solo actualiza en los límites de
+        # cada fase y el refresco automático limita los redibujados por segundo.
+        # Fuera de una terminal Rich solo pinta el estado final al cerrar, así
+        # que no se arranca el hilo de refresco.
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -582,74 +1203,76 @@ class CLI:
             TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
             console=console,
             transient=False,
+            auto_refresh=console.is_terminal,
         ) as progress:
             task_id = progress.add_task("[cyan]Generando proyecto...", total=100)
             creator.create(progress, task_id)
 
-    def _show_success(self, args: argparse.Namespace) -> None:
+    def _show_success(self, args: ProjectConfig) -> None:
         """
         Rich UI: Árbol de estructura + comandos siguientes.
+
+        Todo el bloque se compone en un único Group y se imprime con una sola
+        llamada, así Rich renderiza y escribe a stdout una sola vez.
         """
-        console.print()
-        console.print("[bold green]Project created successfully![/bold green]\n")
+        console = _get_console()
+
+        # Salida redirigida (CI, logs): texto plano sin pasar por Rich
+        if not console.is_terminal:
+            nodes = _PYTHON_TREE_NODES if args.type == "python" else _TYPESCRIPT_TREE_NODES
+            console.file.write(
+                "\nProject created successfully!\n\n"
+                f"{_render_plain_tree(args.project_name, nodes)}\n\n"
+                f"{_next_steps(args, plain=True)}\n"
+            )
+            return
+
+        from rich.console import Group
 
         if args.type == "python":
-            self._show_python_success(args)
+            tree, panel = self._build_python_success(args)
         else:
-            self._show_typescript_success(args)
-
-    def _show_python_success(self, args: argparse.Namespace) -> None:
-        # Árbol de estructura Python (simplificado)
-        tree = Tree(f"[bold cyan]{args.project_name}[/bold cyan]", guide_style="bright_blue")
-        tree.add("app/")
-        tree.add("tests/")
-        tree.add("pyproject.toml")
-        console.print(tree)
-        console.print()
+            tree, panel = self._build_typescript_success(args)
 
         console.print(
-            Panel(
-                f"[bold white]Next steps:[/bold white]\n\n"
-                f"[cyan]1.[/cyan] cd {args.project_name}\n"
-                f"[cyan]2.[/cyan] uv sync\n"
-                f"[cyan]3.[/cyan] docker-compose up -d\n"
-                f"[cyan]4.[/cyan] alembic upgrade head\n"
-                f"[cyan]5.[/cyan] uv run uvicorn app.main:app --reload",
-                title="[bold]Python API Ready[/bold]",
-                border_style="green",
-                box=box.DOUBLE,
+            Group(
+                "",
+                "[bold green]Project created successfully![/bold green]\n",
+                tree,
+                "",
+                panel,
             )
         )
 
-    def _show_typescript_success(self, args: argparse.Namespace) -> None:
-        pm = getattr(args, "package_manager", "pnpm")
-        run_cmd = "npm run" if pm == "npm" else pm
+    def _build_python_success(self, args: ProjectConfig) -> tuple["Tree", "Panel"]:
+        from rich import box
+        from rich.panel import Panel
+
+        # Árbol de estructura Python (simplificado)
+        tree = _build_tree(args.project_name, _PYTHON_TREE_NODES)
+
+        panel = Panel(
+            _next_steps(args),
+            title="[bold]Python API Ready[/bold]",
+            border_style="green",
+            box=box.DOUBLE,
+        )
+        return tree, panel
+
+    def _build_typescript_success(self, args: ProjectConfig) -> tuple["Tree", "Panel"]:
+        from rich import box
+        from rich.panel import Panel
 
         # Árbol de estructura TypeScript
-        tree = Tree(f"[bold cyan]{args.project_name}[/bold cyan]", guide_style="bright_blue")
-        src = tree.add("src/")
-        src.add("agents/ (LLM Agnostic Core)")
-        src.add("database/ (Drizzle ORM)")
-        src.add("config/")
-        tree.add("package.json")
-        tree.add("docker-compose.yml")
-        console.print(tree)
-        console.print()
+        tree = _build_tree(args.project_name, _TYPESCRIPT_TREE_NODES)
 
-        console.print(
-            Panel(
-                f"[bold white]Next steps:[/bold white]\n\n"
-                f"[cyan]1.[/cyan] cd {args.project_name}\n"
-                f"[cyan]2.[/cyan] {pm} install\n"
-                f"[cyan]3.[/cyan] docker-compose up -d db redis\n"
-                f"[cyan]4.[/cyan] {run_cmd} db:push\n"
-                f"[cyan]5.[/cyan] {run_cmd} start:dev\n\n"
-                f"[bold green]API Docs:[/bold green] http://localhost:3000/api/docs",
-                title="[bold]NestJS AI Agent Ready[/bold]",
-                border_style="green",
-                box=box.DOUBLE,
-            )
+        panel = Panel(
+            _next_steps(args),
+            title="[bold]NestJS AI Agent Ready[/bold]",
+            border_style="green",
+            box=box.DOUBLE,
         )
+        return tree, panel
 
     def _handle_update(self, args: argparse.Namespace) -> int:
         """
@@ -661,16 +1284,22 @@ class CLI:
         Returns:
             Exit code (0 = success, 1 = error).
         """
-        project_dir = args.project_dir
+        console = _get_console()
+
+        project_dir = args.project_dir or self._cwd
 
-        # Validar que el proyecto existe
-        if not project_dir.exists():
+        # Validar existencia y detectar tipo con un único listado del directorio
+        try:
+            with os.scandir(project_dir) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
             console.print(f"[red]! Error:[/red] El directorio '{project_dir}' no existe")
             return 1
+        except NotADirectoryError:
+            names = set()
 
-        # Detectar tipo de proyecto
-        is_typescript = (project_dir / "package.json").exists()
-        is_python = (project_dir / "pyproject.toml").exists()
+        is_typescript = "package.json" in names
+        is_python = "pyproject.toml" in names
 
         if not is_typescript and not is_python:
             console.print("[red]! Error:[/red] No se pudo detectar el tipo de proyecto")
@@ -687,9 +1316,9 @@ class CLI:
 
         # Mostrar qué se va a agregar
         features_to_add = []
-        if getattr(args, "add_rag", False):
+        if args.add_rag:
             features_to_add.append("RAG (pgvector + embeddings)")
-        if getattr(args, "add_queue", False):
+        if args.add_queue:
             features_to_add.append("Queue (BullMQ)")
 
         if not features_to_add:
@@ -719,4 +1348,4 @@ def main() -> None:
     Entry point del CLI.
     """
     cli = CLI()
-    exit(cli.run())
+    sys.exit(cli.run())
@@ -4,15 +4,75 @@ Creator (GRASP): Responsable de crear estructura física del proyecto.
 """
 
 import contextlib
+import functools
+import os
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
-
-from rich.progress import Progress
+from typing import TYPE_CHECKING, Any
 
 from generator.templates.base import FileTemplate
 
+# Solo para anotaciones: importar el creator no debe cargar Rich
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+
+# Flags de escritura: O_BINARY (solo Windows) evita que el CRT traduzca bytes;
+# los saltos de línea de la plataforma los aplica _encode.
+# Sobrescribir trunca; si no, O_EXCL hace que el propio open detecte el
+# archivo existente, sin un stat previo por template.
+_BASE_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+_OVERWRITE_FLAGS = _BASE_WRITE_FLAGS | os.O_TRUNC
+_EXCLUSIVE_FLAGS = _BASE_WRITE_FLAGS | os.O_EXCL
+# Salto de línea de la plataforma, como hacía write_text (CRLF en Windows)
+_LINESEP = os.linesep.encode()
+
+
+def _encode(content: str) -> bytes:
+    """
+    Helper: Codifica un template a UTF-8 con los saltos de línea de la plataforma.
+
+    El descriptor crudo no traduce "\n"; solo se reemplaza donde os.linesep
+    no es "\n", así en POSIX queda un único encode.
+    """
+    data = content.encode()
+    return data if _LINESEP == b"\n" else data.replace(b"\n", _LINESEP)
+
+
+def _write_file(file_path: str, data: bytes, flags: int) -> None:
+    """
+    Helper: Escribe un archivo (su directorio ya existe tras _create_directories).
+
+    Bytes ya codificados sobre un descriptor crudo: open/write/close sin la
+    capa de TextIOWrapper. Con _EXCLUSIVE_FLAGS un archivo ya existente se
+    omite. Función de módulo para poder despacharla a un ThreadPoolExecutor.
+    """
+    try:
+        fd = os.open(file_path, flags, 0o666)
+    except FileExistsError:
+        return  # Ya existe y no se quiere sobrescribir
+
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+@functools.cache
+def _find_executable(name: str) -> str | None:
+    """
+    Singleton perezoso: ruta absoluta de un ejecutable en PATH (None si falta).
+
+    Se busca una vez por proceso; lanzar el subproceso con la ruta absoluta
+    evita repetir la búsqueda en PATH.
+    """
+    return shutil.which(name)
+
 
 class ProjectCreator(ABC):
     """
@@ -33,12 +93,17 @@ class ProjectCreator(ABC):
         self._target_path = target_path
         self._options = options
         self._templates: list[FileTemplate] = []
+        # `git init` lanzado en segundo plano por _start_git_init
+        self._git_init: subprocess.Popen[bytes] | None = None
 
-    def create(self, progress: Progress, task_id: int) -> None:
+    def create(self, progress: "Progress", task_id: int) -> None:
         """
         Template Method (GoF): Define pasos de creación.
         Information Expert (GRASP): Conoce orden de pasos.
 
+        El progreso se actualiza solo al cambiar de fase (nunca por archivo),
+        de modo que el coste de render de Rich no crece con el nº de templates.
+
         Args:
             progress: Objeto Progress de Rich para mostrar progreso.
             task_id: ID de la tarea de progreso.
@@ -62,15 +127,22 @@ class ProjectCreator(ABC):
             completed=(current_step / total_steps) * 100,
         )
         self._create_directories()
+        # git init solo necesita el directorio raíz: corre mientras se escriben archivos
+        self._start_git_init()
         current_step += 1
 
         # Paso 3: Crear archivos
-        progress.update(
-            task_id,
-            description="[cyan]Generando archivos...",
-            completed=(current_step / total_steps) * 100,
-        )
-        self._create_files()
+        try:
+            progress.update(
+                task_id,
+                description="[cyan]Generando archivos...",
+                completed=(current_step / total_steps) * 100,
+            )
+            self._create_files()
+        except BaseException:
+            # Sin archivos no hay repositorio: no dejar el git init huérfano
+            self._abort_git_init()
+            raise
         current_step += 1
 
         # Paso 4: Inicializar git
@@ -121,26 +193,34 @@ class ProjectCreator(ABC):
         """
         Pure Fabrication (GRASP): Lógica técnica, no de dominio.
         Crea todos los directorios necesarios para los archivos.
+
+        Un solo mkdir por directorio único: el orden garantiza que cada padre
+        se crea antes que sus hijos, así que solo la raíz necesita parents=True.
         """
-        dirs = self._extract_directories()
-        for directory in sorted(dirs):
-            full_path = self._target_path / directory
-            full_path.mkdir(parents=True, exist_ok=True)
+        self._target_path.mkdir(parents=True, exist_ok=True)
 
-    def _extract_directories(self) -> set[Path]:
+        # Orden lexicográfico: un prefijo ("app") siempre precede a "app/api"
+        for directory in sorted(self._extract_directories()):
+            (self._target_path / directory).mkdir(exist_ok=True)
+
+    def _extract_directories(self) -> set[str]:
         """
-        Helper: Extrae directorios únicos de templates.
+        Helper: Extrae directorios únicos (y sus ancestros) de los templates.
+
+        Las rutas relativas ya son POSIX normalizadas, así que se recortan
+        como strings sin construir un PurePath por cada nivel.
         """
-        dirs: set[Path] = {Path(".")}  # Raíz siempre
+        dirs: set[str] = set()
 
         for template in self._templates:
-            path = Path(template.relative_path)
-            current = path.parent
+            path = template.relative_path
+            end = path.rfind("/")
 
-            # Agregar directorio y todos sus padres
-            while current != Path("."):
-                dirs.add(current)
-                current = current.parent
+            # Agregar directorio y todos sus padres; se corta al llegar a uno
+            # ya registrado (sus ancestros también lo están)
+            while end > 0 and path[:end] not in dirs:
+                dirs.add(path[:end])
+                end = path.rfind("/", 0, end)
 
         return dirs
 
@@ -148,47 +228,104 @@ class ProjectCreator(ABC):
         """
         Protected Variations (GRASP): Protege contra cambios en I/O.
         Crea todos los archivos a partir de los templates.
+
+        Las escrituras (muchos archivos pequeños, I/O-bound) se reparten en un
+        pool de hilos. La opción "jobs" fija el nº de hilos (1 = secuencial,
+        None = automático).
         """
-        for template in self._templates:
-            file_path = self._target_path / template.relative_path
+        jobs = self._options.get("jobs")
+        flags = _OVERWRITE_FLAGS if self._options.get("overwrite", False) else _EXCLUSIVE_FLAGS
+        # Rutas como str con os.path.join: os.open no necesita un Path por archivo
+        target_dir = os.fspath(self._target_path)
+
+        if jobs == 1:
+            for template in self._templates:
+                _write_file(
+                    os.path.join(target_dir, template.relative_path),
+                    _encode(template.get_content()),
+                    flags,
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # Cada escritura se despacha en cuanto su contenido está listo, así
+            # la generación del siguiente template se solapa con el I/O en curso.
+            futures = [
+                executor.submit(
+                    _write_file,
+                    os.path.join(target_dir, template.relative_path),
+                    _encode(template.get_content()),
+                    flags,
+                )
+                for template in self._templates
+            ]
+
+        # Propaga la primera excepción de escritura
+        for future in futures:
+            future.result()
+
+    def _start_git_init(self) -> None:
+        """
+        Lanza `git init` en segundo plano si el repositorio no existe.
 
-            # Skip si ya existe y no se quiere sobrescribir
-            if file_path.exists() and not self._options.get("overwrite", False):
-                continue
+        No bloquea: _initialize_git recoge el proceso cuando ya se han
+        escrito los archivos.
+        """
+        # Git es opcional: si no está instalado simplemente no hay repositorio
+        git = _find_executable("git")
+        if git is None or (self._target_path / ".git").exists():
+            return  # Sin git o ya inicializado
 
-            # Asegurar que el directorio padre existe
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(OSError):
+            self._git_init = subprocess.Popen(
+                [git, "init"],
+                cwd=self._target_path,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
 
-            # Obtener contenido y escribir archivo
-            content = template.get_content()
-            file_path.write_text(content, encoding="utf-8")
+    def _abort_git_init(self) -> None:
+        """
+        Detiene el `git init` en segundo plano y elimina el .git que haya creado.
+
+        Solo se lanzó si .git no existía, así que borrarlo deja el directorio
+        como estaba antes de la inicialización.
+        """
+        process, self._git_init = self._git_init, None
+        if process is None:
+            return
+
+        process.kill()
+        process.wait()
+        shutil.rmtree(self._target_path / ".git", ignore_errors=True)
 
     def _initialize_git(self) -> None:
         """
-        Inicializa repositorio git si no existe.
+        Espera al `git init` en segundo plano y agrega .gitignore al índice.
         """
-        git_dir = self._target_path / ".git"
-        if git_dir.exists():
-            return  # Ya está inicializado
+        process, self._git_init = self._git_init, None
+        if process is None:
+            return  # Ya inicializado o git no disponible
 
         try:
-            # git init
-            subprocess.run(
-                ["git", "init"], cwd=self._target_path, check=True, capture_output=True, timeout=10
-            )
+            if process.wait(timeout=10) != 0:
+                return
 
             # git add .gitignore
             # Solo si existe .gitignore
             if (self._target_path / ".gitignore").exists():
                 subprocess.run(
-                    ["git", "add", ".gitignore"],
+                    [_find_executable("git"), "add", ".gitignore"],
                     cwd=self._target_path,
                     check=True,
                     capture_output=True,
                     timeout=10,
                 )
-        except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        except subprocess.TimeoutExpired:
             # Git es opcional, no bloquea si falla
+            process.kill()
+            process.wait()
+        except (subprocess.CalledProcessError, FileNotFoundError):
             pass
 
     def _install_pre_commit(self) -> None:
@@ -198,11 +335,16 @@ class ProjectCreator(ABC):
         if not (self._target_path / ".pre-commit-config.yaml").exists():
             return
 
+        # Sin pre-commit en PATH no se paga el fork/exec de un intento fallido
+        pre_commit = _find_executable("pre-commit")
+        if pre_commit is None:
+            return
+
         with contextlib.suppress(
             subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired
         ):
             subprocess.run(
-                ["pre-commit", "install"],
+                [pre_commit, "install"],
                 cwd=self._target_path,
                 check=True,
                 capture_output=True,
@@ -3,12 +3,12 @@ Pure Fabrication (GRASP): Clases artificiales para representar templates.
 Single Responsibility (SOLID): Solo contiene estructuras de datos y helpers.
 """
 
-import textwrap
+import functools
 from collections.abc import Callable
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileTemplate:
     """
     Pure Fabrication (GRASP): Clase artificial para representar archivos.
@@ -36,6 +36,7 @@ class FileTemplate:
         return self.content() if callable(self.content) else self.content
 
 
+@functools.lru_cache(maxsize=256)
 def dedent(text: str) -> str:
     """
     Helper: Normaliza indentación de strings multi-línea.
@@ -43,10 +44,36 @@ def dedent(text: str) -> str:
     Elimina indentación común, quita línea vacía inicial y asegura
     salto de línea final.
 
+    Mismo resultado que textwrap.dedent, pero en una sola pasada sobre las
+    líneas y sin regex. Memoizado: los cuerpos de template son literales que
+    se repiten en cada generación dentro del mismo proceso.
+
     Args:
         text: Texto con posible indentación.
 
     Returns:
         Texto sin indentación común y normalizado.
     """
-    return textwrap.dedent(text).lstrip("\n").rstrip() + "\n"
+    lines = text.split("\n")
+
+    # Margen común: prefijo de espacios/tabs compartido por las líneas con texto
+    margin: str | None = None
+    for line in lines:
+        content = line.lstrip(" \t")
+        if not content:
+            continue
+        indent = line[: len(line) - len(content)]
+        if margin is None or margin.startswith(indent):
+            margin = indent
+        elif not indent.startswith(margin):
+            common = 0
+            for a, b in zip(margin, indent, strict=False):
+                if a != b:
+                    break
+                common += 1
+            margin = margin[:common]
+
+    # Las líneas solo con espacios quedan vacías, como en textwrap.dedent
+    width = len(margin or "")
+    dedented = "\n".join(line[width:] if line.lstrip(" \t") else "" for line in lines)
+    return dedented.lstrip("\n").rstrip() + "\n"
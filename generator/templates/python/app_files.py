@@ -217,7 +217,8 @@ def _create_config_template(project_name: str) -> FileTemplate:
     """Singleton for configuration with pydantic-settings."""
     return FileTemplate(
         "app/core/config.py",
-        dedent(f"""
+        # Cuerpo literal constante: dedent memoizado y solo format() por llamada
+        dedent("""
         from functools import lru_cache
 
         from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -273,7 +274,7 @@ def _create_config_template(project_name: str) -> FileTemplate:
 
         # Instancia global
         settings = get_settings()
-    """),
+    """).format(project_name=project_name),
     )
 
 
@@ -3,6 +3,8 @@ Templates para archivos de configuración e infraestructura.
 Incluye Docker, Alembic, linters, etc.
 """
 
+import functools
+
 from generator.templates.base import FileTemplate, dedent
 
 
@@ -20,7 +22,20 @@ def get_config_templates(
     Returns:
         Lista de FileTemplate con archivos de configuración.
     """
-    templates = [
+    # Copia: el llamador recibe una lista propia; los FileTemplate son inmutables
+    return list(_cached_config_templates(project_name, include_docker, include_cicd))
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_config_templates(
+    project_name: str, include_docker: bool, include_cicd: bool
+) -> tuple[FileTemplate, ...]:
+    """
+    Helper: Construye los templates de configuración una vez por combinación
+    de argumentos; FileTemplate es frozen, así que la tupla se comparte.
+    """
+    # Tuplas literales concatenadas: sin list intermedia ni redimensionados
+    base = (
         _create_env_example_template(),
         _create_gitignore_template(),
         _create_pyproject_toml_template(project_name),
@@ -31,20 +46,13 @@ def get_config_templates(
         _create_alembic_script_mako_template(),
         FileTemplate("alembic/versions/.gitkeep", "# Mantiene directorio versions en git\n"),
         _create_readme_template(project_name),
-    ]
-
-    if include_docker:
-        templates.extend(
-            [
-                _create_dockerfile_template(),
-                _create_docker_compose_template(),
-            ]
-        )
-
-    if include_cicd:
-        templates.extend(get_cicd_templates(project_name))
+    )
+    docker = (
+        (_create_dockerfile_template(), _create_docker_compose_template()) if include_docker else ()
+    )
+    cicd = tuple(get_cicd_templates(project_name)) if include_cicd else ()
 
-    return templates
+    return (*base, *docker, *cicd)
 
 
 # ==================== .env.example ====================
@@ -162,7 +170,8 @@ def _create_pyproject_toml_template(project_name: str) -> FileTemplate:
     """Complete configuration with uv and ruff."""
     return FileTemplate(
         "pyproject.toml",
-        dedent(f"""
+        # Cuerpo literal constante: dedent memoizado y solo format() por llamada
+        dedent("""
         [project]
         name = "{project_name}"
         version = "0.1.0"
@@ -230,7 +239,7 @@ def _create_pyproject_toml_template(project_name: str) -> FileTemplate:
         line-ending = "auto"
 
         [tool.ruff.lint.isort]
-        known-first-party = ["{project_name.replace("-", "_")}"]
+        known-first-party = ["{package_name}"]
 
         # Configuración de Pytest
         [tool.pytest.ini_options]
@@ -257,7 +266,7 @@ def _create_pyproject_toml_template(project_name: str) -> FileTemplate:
             "if __name__ == .__main__.:",
             "if TYPE_CHECKING:",
         ]
-    """),
+    """).format(project_name=project_name, package_name=project_name.replace("-", "_")),
     )
 
 
@@ -711,7 +720,7 @@ def _create_readme_template(project_name: str) -> FileTemplate:
     """Complete README with documentation."""
     return FileTemplate(
         "README.md",
-        dedent(f"""
+        dedent("""
         # {project_name}
 
         FastAPI Clean Architecture API applying SOLID principles and GoF/GRASP design patterns.
@@ -981,7 +990,7 @@ def _create_readme_template(project_name: str) -> FileTemplate:
         - SQLAlchemy for the powerful ORM
         - Alembic for migrations
         - Ruff for ultra-fast linting
-    """),
+    """).format(project_name=project_name),
     )
 
 
@@ -1082,7 +1091,7 @@ def _create_github_release_workflow_template(project_name: str) -> FileTemplate:
     """Workflow de publicación a PyPI."""
     return FileTemplate(
         ".github/workflows/release.yml",
-        dedent(f"""
+        dedent("""
             name: Publish to PyPI
 
             on:
@@ -1117,7 +1126,7 @@ def _create_github_release_workflow_template(project_name: str) -> FileTemplate:
                     uses: pypa/gh-action-pypi-publish@release/v1
                     with:
                       verbose: true
-        """),
+        """).format(project_name=project_name),
     )
 
 
@@ -1125,7 +1134,7 @@ def _create_github_testpypi_workflow_template(project_name: str) -> FileTemplate
     """Workflow de publicación a TestPyPI."""
     return FileTemplate(
         ".github/workflows/test-pypi.yml",
-        dedent(f"""
+        dedent("""
             name: Publish to TestPyPI
 
             on:
@@ -1162,7 +1171,7 @@ def _create_github_testpypi_workflow_template(project_name: str) -> FileTemplate
                     with:
                       repository-url: https://test.pypi.org/legacy/
                       verbose: true
-        """),
+        """).format(project_name=project_name),
     )
 
 
@@ -4,11 +4,15 @@ Open/Closed (SOLID): Extendible sin modificar código existente.
 Template Method (GoF): validate() define estructura fija.
 """
 
+import functools
 import os
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+# Compilado una sola vez a nivel de módulo (anclado de extremo a extremo con fullmatch)
+_PROJECT_NAME_PATTERN = re.compile(r"[a-zA-Z0-9][a-zA-Z0-9_-]*")
+
 
 class ValidationError(Exception):
     """
@@ -90,7 +94,7 @@ class ProjectNameValidator(Validator):
         Raises:
             ValidationError: Si el nombre no cumple con el formato.
         """
-        if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9_-]*$", project_name):
+        if not _PROJECT_NAME_PATTERN.fullmatch(project_name):
             raise ValidationError(
                 "Nombre debe comenzar con alfanumérico y solo contener a-z, 0-9, -, _"
             )
@@ -110,9 +114,19 @@ class DirectoryExistsValidator(Validator):
         Valida que el directorio no exista o esté vacío.
 
         Raises:
-            ValidationError: Si el directorio existe y no está vacío.
+            ValidationError: Si el directorio existe y no está vacío, o si la
+                ruta existe pero es un archivo.
         """
-        if target_path.exists() and any(target_path.iterdir()):
+        # scandir directo: un solo syscall responde existencia y contenido
+        try:
+            with os.scandir(target_path) as entries:
+                is_empty = next(entries, None) is None
+        except FileNotFoundError:
+            return
+        except NotADirectoryError:
+            raise ValidationError(f"{target_path} existe y no es un directorio") from None
+
+        if not is_empty:
             raise ValidationError(
                 f"Directorio {target_path} existe y no está vacío. "
                 "Use --overwrite para sobrescribir."
@@ -140,11 +154,15 @@ class WritablePathValidator(Validator):
             raise ValidationError(f"Sin permisos de escritura en {parent}")
 
 
+@functools.lru_cache(maxsize=1)
 def create_validator_chain() -> Validator:
     """
     Factory Method (GoF): Encapsula creación de la cadena de validadores.
     Creator (GRASP): Responsable de crear y configurar validadores.
 
+    Los validadores no tienen estado, así que la cadena se construye una vez
+    por proceso y se comparte.
+
     Crea la cadena en orden específico:
     1. Valida nombre del proyecto
     2. Valida que directorio no exista